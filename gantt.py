@@ -1,10 +1,16 @@
 import os
+import time
+import threading
 import streamlit as st
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 import pandas as pd
+import numpy as np
 import plotly.graph_objects as go
 import plotly.express as px
 from notion_client import Client
 from datetime import timedelta
+from itertools import groupby
+from concurrent.futures import ThreadPoolExecutor
 import requests
 
 # --- 상수 정의 (Notion API 직접 호출용) ---
@@ -12,6 +18,19 @@ NOTION_API_URL = "https://api.notion.com/v1"
 NOTION_VERSION = "2022-06-28" 
 # Notion API 버전. 이 값을 사용하시면 됩니다.
 
+# 디스크 캐시 확인용 최종 수정 시각 조회의 요청 타임아웃 (초)
+LAST_EDITED_TIME_TIMEOUT = 10
+
+# 가공된 데이터를 DB 최종 수정 시각별 parquet 파일로 보관하는 디렉터리
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache")
+
+# parquet 파일을 신뢰하는 최대 경과 시간 (초). 메모리 캐시 ttl과 같게 두어, 항목 삭제나
+# Project DB 제목 변경처럼 최종 수정 시각을 바꾸지 않는 변경도 기존과 같이 10분 안에 반영되도록 합니다.
+CACHE_MAX_AGE_SECONDS = 600
+
+# Notion의 last_edited_time은 분 단위이므로, 키 시각보다 이 시간(초) 이상 뒤에 쓰인 파일만 신뢰합니다.
+LAST_EDITED_TIME_RESOLUTION_SECONDS = 60
+
 # --- 1. 설정 및 초기화 ---
 # Streamlit Secrets에서 API 토큰과 DB ID를 안전하게 가져옵니다.
 notion_token = st.secrets.get("NOTION_TOKEN")
@@ -24,22 +43,52 @@ st.set_page_config(layout="wide", page_title="프로젝트 마일스톤 타임
 plotly_config = {
     'displaylogo': False,
     'displayModeBar': True,
-    'responsive': True
+    'responsive': True,
+    'scrollZoom': True,
+    'doubleClickDelay': 200
 }
 
-# 💡 Session State를 사용하여 Notion Client 안정적으로 초기화
-# Notion API 클라이언트 인스턴스를 세션 상태에 저장합니다.
-if 'notion_client' not in st.session_state:
-    if notion_token:
-        try:
-            # Client 객체는 pages.retrieve를 위해 필요합니다.
-            st.session_state.notion_client = Client(auth=notion_token)
-        except Exception as e:
-            st.error(f"Notion 클라이언트 초기화 중 오류가 발생했습니다: {e}")
-            # 이 경우 notion_token이 유효하지 않은 것일 수 있습니다.
-            st.session_state.notion_client = None
-    else:
-        st.session_state.notion_client = None
+# 하위 마일스톤 점 개수가 아래 기준을 넘으면 SVG(go.Scatter) 대신 WebGL(go.Scattergl)로 그립니다.
+# 기준 이하의 작은 차트는 SVG가 초기화 비용이 낮고 렌더링도 선명하므로 go.Scatter를 그대로 사용합니다.
+SCATTERGL_MIN_POINTS = 1000
+
+# Project DB 페이지 제목을 동시에 조회할 최대 스레드 수
+PAGE_TITLE_FETCH_WORKERS = 8
+
+# Project DB 제목 조회 실패 시 대신 표시하는 이름
+# (일시적인 오류일 수 있으므로 이 이름이 포함된 결과는 디스크 캐시에 저장하지 않습니다.)
+PAGE_TITLE_CLIENT_ERROR = "이름 없음 (클라이언트 오류)"
+PAGE_TITLE_FETCH_ERROR = "이름 없음 (권한 오류)"
+
+# 💡 st.cache_resource를 사용하여 Notion Client 안정적으로 초기화
+# 리런이나 사용자 세션마다 새로 만들지 않고, 하나의 클라이언트(와 연결 풀)를 공유합니다.
+@st.cache_resource
+def get_notion_client():
+    """Notion API 클라이언트 인스턴스를 반환합니다. (토큰이 없거나 초기화에 실패하면 None)"""
+    if not notion_token:
+        return None
+
+    try:
+        # Client 객체는 pages.retrieve를 위해 필요합니다.
+        return Client(auth=notion_token)
+    except Exception as e:
+        st.error(f"Notion 클라이언트 초기화 중 오류가 발생했습니다: {e}")
+        # 이 경우 notion_token이 유효하지 않은 것일 수 있습니다.
+        return None
+
+
+# requests로 Notion API를 직접 호출하는 함수들이 공유하는 헤더와 URL
+def get_notion_headers() -> dict:
+    """Notion API 직접 호출에 사용하는 공통 요청 헤더를 반환합니다."""
+    return {
+        "Authorization": f"Bearer {notion_token}",
+        "Notion-Version": NOTION_VERSION,
+        "Content-Type": "application/json",
+    }
+
+def get_database_query_url(database_id: str) -> str:
+    """데이터베이스 쿼리 엔드포인트 URL을 반환합니다."""
+    return f"{NOTION_API_URL}/databases/{database_id}/query"
 
 
 # --- 2. Notion 데이터 가져오기 (requests 우회) ---
@@ -52,88 +101,119 @@ def get_notion_database_data(database_id: str) -> list:
     if not notion_token or not database_id:
         return []
 
-    headers = {
-        "Authorization": f"Bearer {notion_token}",
-        "Notion-Version": NOTION_VERSION,
-        "Content-Type": "application/json",
-    }
-    
-    full_url = f"{NOTION_API_URL}/databases/{database_id}/query"
+    full_url = get_database_query_url(database_id)
     
-    while True:
-        try:
-            payload = {
-                "sorts": [{"property": "이름", "direction": "ascending"}]
-            }
-            if start_cursor:
-                 payload["start_cursor"] = start_cursor
-
-            # requests.post를 사용하여 API에 직접 요청
-            response = requests.post(
-                full_url, 
-                headers=headers, 
-                json=payload
-            )
+    # 페이지네이션 요청 사이에 TCP/TLS 연결을 재사용하도록 Session을 사용합니다.
+    with requests.Session() as session:
+        session.headers.update(get_notion_headers())
+
+        while True:
+            try:
+                # 요청 횟수를 줄이도록 API 최대값(100)을 명시합니다.
+                payload = {
+                    "sorts": [{"property": "이름", "direction": "ascending"}],
+                    "page_size": 100,
+                }
+                if start_cursor:
+                     payload["start_cursor"] = start_cursor
+
+                # session.post를 사용하여 API에 직접 요청
+                response = session.post(
+                    full_url, 
+                    json=payload
+                )
             
-            # HTTP 오류 상태 코드 확인 (400, 401, 404 등)
-            response.raise_for_status() 
+                # HTTP 오류 상태 코드 확인 (400, 401, 404 등)
+                response.raise_for_status() 
             
-            data = response.json()
+                data = response.json()
             
-            all_results.extend(data["results"])
+                all_results.extend(data["results"])
             
-            if not data["has_more"]:
-                break
+                if not data["has_more"]:
+                    break
             
-            start_cursor = data["next_cursor"]
+                start_cursor = data["next_cursor"]
             
-        except requests.exceptions.RequestException as req_e:
-            # requests 라이브러리에서 발생하는 오류 처리 (네트워크, HTTP 오류 등)
-            status_code = req_e.response.status_code if req_e.response is not None else 'N/A'
-            error_details = req_e.response.json() if req_e.response and req_e.response.content else str(req_e)
+            except requests.exceptions.RequestException as req_e:
+                # requests 라이브러리에서 발생하는 오류 처리 (네트워크, HTTP 오류 등)
+                status_code = req_e.response.status_code if req_e.response is not None else 'N/A'
+                error_details = req_e.response.json() if req_e.response and req_e.response.content else str(req_e)
             
-            st.error("❌ Notion 데이터 로드 중 치명적인 HTTP/API 오류 발생.")
-            st.warning(f"상태 코드: {status_code}")
+                st.error("❌ Notion 데이터 로드 중 치명적인 HTTP/API 오류 발생.")
+                st.warning(f"상태 코드: {status_code}")
             
-            if status_code in [401, 403]:
-                st.info("💡 권한 문제로 보입니다. Notion 통합(Integration)이 데이터베이스에 명시적으로 초대되었는지 확인해 주세요.")
+                if status_code in [401, 403]:
+                    st.info("💡 권한 문제로 보입니다. Notion 통합(Integration)이 데이터베이스에 명시적으로 초대되었는지 확인해 주세요.")
             
-            st.exception(f"오류: {error_details}")
-            return []
-        except Exception as e:
-            st.error("❌ 데이터 처리 중 일반 오류 발생.")
-            st.exception(e)
-            return []
+                st.exception(f"오류: {error_details}")
+                return []
+            except Exception as e:
+                st.error("❌ 데이터 처리 중 일반 오류 발생.")
+                st.exception(e)
+                return []
             
     return all_results
 
 # --- 3. Project DB 이름 조회 함수 (Notion Client 재사용) ---
-def get_page_title_by_id(page_id: str) -> str:
-    """페이지 ID를 사용하여 해당 페이지의 제목을 조회합니다. (notion-client 사용)"""
-    notion_client_instance = st.session_state.notion_client
-    
+@st.cache_data(ttl=600, show_spinner=False)
+def get_page_title_by_id(page_id: str, _notion_client) -> str:
+    """
+    페이지 ID를 사용하여 해당 페이지의 제목을 조회합니다. (notion-client 사용)
+    여러 항목이 같은 Project DB를 가리키는 경우가 많으므로 page_id별로 결과를 캐시합니다.
+    (_notion_client는 밑줄로 시작하므로 캐시 키 해싱에서 제외됩니다.)
+    조회 실패 시에는 예외를 그대로 올려 오류 결과가 캐시되지 않도록 하며, 대체 이름은 fetch_page_titles에서 정합니다.
+    """
+    # databases.query와 달리 pages.retrieve는 notion-client가 정상 작동할 가능성이 높음
+    page = _notion_client.pages.retrieve(page_id=page_id)
+    for prop_name, prop_data in page["properties"].items():
+        if prop_data.get("type") == "title":
+            title_prop = prop_data.get("title", [])
+            return title_prop[0]["plain_text"] if title_prop else "이름 없음"
+    return "이름 없음"
+
+def fetch_page_titles(page_ids: list) -> dict:
+    """
+    여러 페이지의 제목을 스레드 풀로 동시에 조회하여 {페이지 ID: 제목} 딕셔너리로 반환합니다.
+    요청을 순차로 보내면 페이지 수만큼 왕복 지연이 쌓이므로, 최대 PAGE_TITLE_FETCH_WORKERS개씩 겹쳐서 보냅니다.
+    """
+    if not page_ids:
+        return {}
+
+    # 작업 스레드에는 스크립트 스레드에서 가져온 클라이언트를 직접 넘깁니다.
+    notion_client_instance = get_notion_client()
     if not notion_client_instance:
-        return "이름 없음 (클라이언트 오류)"
-        
-    try:
-        # databases.query와 달리 pages.retrieve는 notion-client가 정상 작동할 가능성이 높음
-        page = notion_client_instance.pages.retrieve(page_id=page_id)
-        for prop_name, prop_data in page["properties"].items():
-            if prop_data.get("type") == "title":
-                title_prop = prop_data.get("title", [])
-                return title_prop[0]["plain_text"] if title_prop else "이름 없음"
-        return "이름 없음"
-    except Exception:
-        # Notion API 권한 오류 시에도 안전하게 처리
-        return "이름 없음 (권한 오류)"
+        return {page_id: PAGE_TITLE_CLIENT_ERROR for page_id in page_ids}
+
+    def fetch_title(page_id: str) -> str:
+        try:
+            return get_page_title_by_id(page_id, notion_client_instance)
+        except Exception:
+            # Notion API 권한 오류 시에도 안전하게 처리 (일시적인 오류일 수 있으므로 캐시되지 않습니다)
+            return PAGE_TITLE_FETCH_ERROR
+
+    # 작업 스레드에서도 st.cache_data를 경고 없이 쓸 수 있도록 현재 스크립트 실행 컨텍스트를 연결합니다.
+    script_run_ctx = get_script_run_ctx()
+
+    def attach_script_run_ctx():
+        add_script_run_ctx(threading.current_thread(), script_run_ctx)
+
+    with ThreadPoolExecutor(
+        max_workers=min(PAGE_TITLE_FETCH_WORKERS, len(page_ids)),
+        initializer=attach_script_run_ctx,
+    ) as executor:
+        titles = executor.map(fetch_title, page_ids)
+        return dict(zip(page_ids, titles))
 
 # --- 4. Notion 데이터 가공 (예외 처리 강화) ---
-@st.cache_data(ttl=600)
 def process_notion_data(notion_pages: list) -> pd.DataFrame:
     """
     가져온 Notion 페이지 데이터를 Pandas DataFrame으로 가공합니다.
+    값은 컬럼별 리스트에 모은 뒤 한 번에 DataFrame으로 만듭니다. (행 dict 리스트보다 생성 비용이 낮음)
+    결과는 database_id를 키로 하는 load_cached_df에서 캐시되므로, 페이지 리스트 전체를 해시하지 않도록
+    이 함수에는 캐시를 두지 않습니다.
     """
-    processed_items = []
+    processed_columns = {"id": [], "이름": [], "타임라인": [], "상태": [], "구분": [], "상위 항목 ID": [], "Project DB ID": []}
     
     # 🚨 Notion API가 반환한 실제 컬럼 목록이 비어 있으면 여기서 오류 메시지를 표시합니다.
     # 이 오류는 이제 권한 문제가 아닌, 데이터 가공 이전의 데이터 로드 실패(get_notion_database_data)를 의미합니다.
@@ -152,14 +232,14 @@ def process_notion_data(notion_pages: list) -> pd.DataFrame:
         parent_relation_prop = properties.get("상위 항목", {}).get("relation", [])
         parent_id = parent_relation_prop[0]["id"] if parent_relation_prop else None
         
-        # 최상위 항목 이름 대체 로직
+        # 최상위 항목 이름 대체 대상: Project DB ID만 기록하고, 제목은 루프 이후 한 번에 조회합니다.
+        project_db_id = None
         if parent_id is None:
             project_db_relation = properties.get("🏠 Project DB", {}).get("relation", [])
             if project_db_relation:
                 project_db_id = project_db_relation[0]["id"]
-                project_name = get_page_title_by_id(project_db_id) 
 
-        if project_name == "이름 없음": continue
+        if project_name == "이름 없음" and project_db_id is None: continue
 
         # 2. '구분' 속성 추출 및 안전 처리 (Select 타입)
         item_type = "미분류"
@@ -179,20 +259,34 @@ def process_notion_data(notion_pages: list) -> pd.DataFrame:
         elif status_prop.get("type") == "select" and status_prop.get("select"):
             status = status_prop["select"].get("name", "미정")
 
-        processed_items.append({
-            "id": item["id"],
-            "이름": project_name,
-            "타임라인": end_date,
-            "상태": status,
-            "구분": item_type,
-            "상위 항목 ID": parent_id,
-        })
+        processed_columns["id"].append(item["id"])
+        processed_columns["이름"].append(project_name)
+        processed_columns["타임라인"].append(end_date)
+        processed_columns["상태"].append(status)
+        processed_columns["구분"].append(item_type)
+        processed_columns["상위 항목 ID"].append(parent_id)
+        processed_columns["Project DB ID"].append(project_db_id)
     
-    df = pd.DataFrame(processed_items)
+    df = pd.DataFrame(processed_columns)
+
+    # 최상위 항목 이름 대체 로직: 고유한 Project DB 페이지의 제목을 동시에 조회하여 한 번에 반영합니다.
+    has_project_db = df["Project DB ID"].notna()
+    if has_project_db.any():
+        project_titles = fetch_page_titles(df.loc[has_project_db, "Project DB ID"].unique().tolist())
+        df.loc[has_project_db, "이름"] = df.loc[has_project_db, "Project DB ID"].map(project_titles)
+    df = df[df["이름"] != "이름 없음"].drop(columns=["Project DB ID"]).reset_index(drop=True)
+
+    # 남은 행이 없으면 빈 컬럼이 float64로 만들어져 .str을 쓸 수 없으므로, 문자열 컬럼으로 맞춰
+    # 아래 변환을 그대로 거친 빈 DataFrame(최종 컬럼 포함)을 반환합니다.
+    if df.empty:
+        df = df.astype(str)
     
     # Critical: '타임라인' 컬럼이 존재하도록 보장 후 변환
     if '타임라인' in df.columns:
-        df["타임라인"] = pd.to_datetime(df["타임라인"], errors='coerce')
+        # Notion의 date.start는 항상 'YYYY-MM-DD'로 시작하는 ISO-8601 문자열입니다.
+        # 날짜 부분만 고정 포맷으로 파싱하여 pandas의 C 파서를 사용하고,
+        # 시간/시간대가 포함된 값('YYYY-MM-DDTHH:MM:SS.sss+09:00')도 NaT 없이 같은 날짜로 처리합니다.
+        df["타임라인"] = pd.to_datetime(df["타임라인"].str[:10], format='%Y-%m-%d', errors='coerce')
     else:
         # 데이터가 있지만 '타임라인' 속성이 없을 경우 NaT로 채웁니다.
         df['타임라인'] = pd.NaT 
@@ -201,102 +295,224 @@ def process_notion_data(notion_pages: list) -> pd.DataFrame:
     
     return df
 
+# --- 4-1. 가공 데이터 디스크 캐시 (parquet) ---
+def get_database_last_edited_time(database_id: str) -> str:
+    """데이터베이스에서 가장 최근에 수정된 항목의 last_edited_time을 조회합니다. (실패 시 None)"""
+    payload = {
+        "sorts": [{"timestamp": "last_edited_time", "direction": "descending"}],
+        "page_size": 1,
+    }
+
+    try:
+        response = requests.post(
+            get_database_query_url(database_id),
+            headers=get_notion_headers(),
+            json=payload,
+            timeout=LAST_EDITED_TIME_TIMEOUT,
+        )
+        response.raise_for_status()
+        results = response.json().get("results", [])
+        return results[0].get("last_edited_time") if results else None
+    except Exception:
+        # 디스크 캐시는 부가 기능이므로 조회 실패 시 캐시 없이 진행합니다.
+        return None
+
+def is_disk_cache_fresh(cache_path: str, last_edited_time: str) -> bool:
+    """
+    parquet 캐시 파일을 그대로 써도 되는지 확인합니다.
+    - 파일이 CACHE_MAX_AGE_SECONDS보다 오래되었으면 사용하지 않습니다. (삭제/제목 변경 반영)
+    - 키 시각과 같은 분에 쓰인 파일은 같은 분의 이후 수정을 놓쳤을 수 있으므로 사용하지 않습니다.
+    """
+    try:
+        written_at = os.path.getmtime(cache_path)
+        edited_at = pd.Timestamp(last_edited_time).timestamp()
+    except Exception:
+        return False
+
+    if time.time() - written_at > CACHE_MAX_AGE_SECONDS:
+        return False
+    return written_at >= edited_at + LAST_EDITED_TIME_RESOLUTION_SECONDS
+
+@st.cache_data(ttl=600)
+def load_cached_df(database_id: str) -> pd.DataFrame:
+    """
+    DB의 최종 수정 시각을 키로 하는 parquet 파일이 있고 아직 유효하면(is_disk_cache_fresh) 바로 읽고,
+    없으면 Notion에서 전체 데이터를 가져와 가공한 뒤 parquet 파일로 저장합니다.
+    컨테이너 재시작 직후 첫 로드에서도 전체 페이지네이션 없이 파일 하나만 읽으면 됩니다.
+    (파일은 최대 CACHE_MAX_AGE_SECONDS 동안만 사용하므로, 항목 삭제나 Project DB 제목 변경도 그 안에 반영됩니다.)
+    """
+    if not notion_token or not database_id:
+        return pd.DataFrame()
+
+    last_edited_time = get_database_last_edited_time(database_id)
+    cache_path = None
+    if last_edited_time:
+        cache_key = last_edited_time.replace(":", "-")
+        cache_path = os.path.join(CACHE_DIR, f"{database_id}_{cache_key}.parquet")
+        if os.path.exists(cache_path) and is_disk_cache_fresh(cache_path, last_edited_time):
+            try:
+                return pd.read_parquet(cache_path)
+            except Exception:
+                # 손상된 캐시 파일은 무시하고 새로 가져옵니다.
+                pass
+
+    df = process_notion_data(get_notion_database_data(database_id))
+
+    # Project DB 제목 조회에 실패한 행이 있으면, 오류 이름이 재시작 후에도 남지 않도록 디스크에는 저장하지 않습니다.
+    # (메모리 캐시는 ttl 이후 다시 조회합니다.)
+    has_title_errors = not df.empty and df["이름"].isin([PAGE_TITLE_CLIENT_ERROR, PAGE_TITLE_FETCH_ERROR]).any()
+
+    if cache_path and not df.empty and not has_title_errors:
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            # 같은 DB의 이전 시각 캐시 파일은 정리합니다.
+            for file_name in os.listdir(CACHE_DIR):
+                if file_name.startswith(f"{database_id}_") and file_name.endswith(".parquet"):
+                    os.remove(os.path.join(CACHE_DIR, file_name))
+            df.to_parquet(cache_path, compression="snappy", index=False)
+        except Exception:
+            # 디스크 쓰기에 실패해도 앱 동작에는 영향이 없도록 합니다.
+            pass
+
+    return df
+
 # --- 5. 하위 태스크 데이터 수집 ---
-# (기존 코드와 동일하므로 생략하지 않고 그대로 유지)
-def get_descendant_end_details(task_id: str, df_all_tasks_indexed: pd.DataFrame, parent_child_map: dict) -> list:
+def build_child_index(parent_idx: np.ndarray) -> tuple:
+    """
+    부모 행 번호 배열(parent_idx, 부모가 없으면 -1)을 CSR 형태의 정수 배열 (indptr, children)로 변환합니다.
+    i번째 행의 자식 행 번호는 children[indptr[i]:indptr[i + 1]] 입니다.
+    """
+    child_rows = np.flatnonzero(parent_idx >= 0)
+    # 안정 정렬로 같은 부모 아래 자식들의 원래 순서를 유지합니다.
+    children = child_rows[np.argsort(parent_idx[child_rows], kind="stable")]
+    indptr = np.searchsorted(parent_idx[children], np.arange(len(parent_idx) + 1))
+
+    return indptr, children
+
+def get_descendant_end_details(root: int, indptr: list, children: list, records: list) -> list:
+    """
+    root 행의 모든 하위 항목을 반복 DFS로 탐색하여 (날짜, 이름, 상태, 점 색상, 날짜 문자열, 호버용 태스크 줄) 정보를 날짜순으로 수집합니다.
+    records는 행 번호 순서의 (정렬 키, 타임라인, 이름, 상태, 점 색상, 날짜 문자열, 호버용 태스크 줄) 튜플 리스트이며,
+    표시하지 않을 행은 None입니다.
+    """
+    # (정수 날짜 키, 방문 순서, 행 번호) 튜플로 모아 두면 정렬이 C 수준의 튜플 비교로 끝나고,
+    # 같은 날짜끼리는 방문 순서(전위 순회)가 유지됩니다.
+    visited = []
+
+    # 자식을 역순으로 쌓아 재귀 버전과 같은 전위 순회 순서를 유지합니다.
+    stack = children[indptr[root]:indptr[root + 1]][::-1]
+    while stack:
+        node = stack.pop()
+        record = records[node]
+
+        if record is not None:
+            visited.append((record[0], len(visited), node))
+        stack.extend(children[indptr[node]:indptr[node + 1]][::-1])
+
+    visited.sort()
+
     descendant_details = []
-    
-    if task_id in parent_child_map:
-        for child_id in parent_child_map.get(task_id, []):
-            try:
-                child_task = df_all_tasks_indexed.loc[[child_id]]
-            except KeyError:
-                child_task = pd.DataFrame()
-
-            # 유효성 검사 (타임라인, 이름, 상태가 유효할 때만 추가)
-            if (not child_task.empty and 
-                pd.notna(child_task["타임라인"].iloc[0]) and
-                child_task["이름"].iloc[0] != "이름 없음" and
-                child_task["상태"].iloc[0] != "미정" ):
-                descendant_details.append({
-                    'date': child_task["타임라인"].iloc[0],
-                    'name': child_task["이름"].iloc[0],
-                    'status': child_task["상태"].iloc[0]
-                })
-            descendant_details.extend(get_descendant_end_details(child_id, df_all_tasks_indexed, parent_child_map))
-            
+    for _, _, node in visited:
+        _, date, name, status, color, date_label, task_label = records[node]
+        descendant_details.append({
+            'date': date,
+            'name': name,
+            'status': status,
+            'color': color,
+            'date_label': date_label,
+            'task_label': task_label
+        })
+
     return descendant_details
 
+@st.cache_resource(ttl=600)
+def build_chart_inputs(df_full_data: pd.DataFrame) -> tuple:
+    """
+    필터와 무관한 차트 입력값(ID 인덱스, 자식 인덱스, 행별 레코드)을 계산합니다.
+    필터 변경으로 앱이 다시 실행되어도 데이터가 같으면 캐시된 결과를 재사용합니다.
+    """
+    id_index = pd.Index(df_full_data["id"])
+    # 상위 항목이 없거나 데이터에 존재하지 않는 부모는 -1로 표시됩니다.
+    parent_idx = id_index.get_indexer(df_full_data["상위 항목 ID"])
+
+    # 하위 항목 탐색을 위한 부모 -> 자식 인덱스를 전체 데이터에서 생성 (중간 단계 부모 포함)
+    indptr, children = build_child_index(parent_idx)
+
+    plotly_qualitative_colors = np.array(px.colors.qualitative.Plotly, dtype=object)
+    
+    # 하위 항목 이름별로 색상을 지정합니다. 정렬된 고유 이름의 코드로 팔레트를 한 번에 인덱싱하여
+    # 행별 점 색상을 미리 계산해 두므로, 차트를 그릴 때는 색상 조회가 필요 없습니다.
+    has_parent = df_full_data['상위 항목 ID'].notna().to_numpy()
+    _, name_codes = np.unique(df_full_data['이름'].to_numpy()[has_parent], return_inverse=True)
+    point_colors = np.full(len(df_full_data), 'lightgray', dtype=object)
+    point_colors[has_parent] = plotly_qualitative_colors[name_codes % len(plotly_qualitative_colors)]
+
+    # 호버 텍스트용 날짜 문자열은 컬럼 단위로 한 번에 포맷합니다.
+    date_labels = df_full_data["타임라인"].dt.strftime('%Y/%m/%d')
+    # 호버 텍스트의 태스크 줄도 행마다 f-string으로 만들지 않고 컬럼 단위로 한 번에 만듭니다.
+    task_labels = "<b>태스크: " + df_full_data["이름"].astype(str) + "</b><br>"
+
+    # 유효성 검사 (타임라인, 이름, 상태가 유효할 때만 표시)도 컬럼 단위로 미리 계산하여,
+    # 탐색 중에는 표시하지 않을 행을 None으로 바로 건너뜁니다.
+    is_valid = (
+        df_full_data["타임라인"].notna()
+        & (df_full_data["이름"] != "이름 없음")
+        & (df_full_data["상태"] != "미정")
+    ).tolist()
+
+    records = [
+        record if valid else None
+        for record, valid in zip(
+            zip(
+                # 하위 항목 정렬용 정수 키 (datetime64 값을 그대로 int64로 해석)
+                df_full_data["타임라인"].to_numpy().view("int64").tolist(),
+                df_full_data["타임라인"].tolist(),
+                df_full_data["이름"].tolist(),
+                df_full_data["상태"].tolist(),
+                point_colors.tolist(),
+                date_labels.tolist(),
+                task_labels.tolist(),
+            ),
+            is_valid,
+        )
+    ]
+
+    # 노드마다 numpy 슬라이스를 만들지 않도록 탐색용 인덱스는 파이썬 리스트로 넘깁니다.
+    return id_index, indptr.tolist(), children.tolist(), records
+
 # --- 6. 타임라인 차트 생성 ---
-# (기존 코드와 동일하므로 생략하지 않고 그대로 유지)
+@st.cache_resource(ttl=600)
 def create_timeline_chart(df_filtered: pd.DataFrame, df_full_data: pd.DataFrame) -> go.Figure:
     """
     필터링된 데이터를 사용하여 타임라인 차트를 생성하고, 최상위 항목의 '구분'에 따라 색상을 적용합니다.
+    데이터와 필터가 같으면 다시 실행되어도 캐시된 Figure 객체를 그대로 반환하므로, 반환값은 수정하지 않습니다.
     """
-    # Y축 라벨로 사용할 최상위 항목 (df_filtered에서 부모가 없는 항목)
-    top_level_tasks = df_filtered[df_filtered["상위 항목 ID"].isnull()].copy()
-    
     # --- 정렬 순서 수정: project > project/poc hybrid > poc 순 ---
-    def get_sort_key(item_type):
-        if item_type == 'project':
-            return 0 
-        elif item_type == 'poc':
-            return 2 
-        else:
-            return 1 
-    
-    top_level_tasks['sort_key'] = top_level_tasks['구분_lower'].apply(get_sort_key)
-    top_level_tasks = top_level_tasks.sort_values(
-        by=['sort_key', '이름'], 
-        ascending=[True, True]
-    ).drop(columns=['sort_key']) 
-
-    fig = go.Figure()
+    # 'project'는 0, 'poc'는 2, 그 외(hybrid 등)는 1로 정렬합니다.
+    type_sort_order = {'project': 0, 'poc': 2}
 
-    # 재귀 탐색을 위한 부모 -> 자식 ID 맵을 전체 데이터에서 생성
-    parent_child_map = {}
-    for _, row in df_full_data.iterrows():
-        if pd.notna(row["상위 항목 ID"]) and row["상위 항목 ID"] in top_level_tasks['id'].tolist():
-            parent_child_map.setdefault(row["상위 항목 ID"], []).append(row["id"])
+    # Y축 라벨로 사용할 최상위 항목 (df_filtered에서 부모가 없는 항목)
+    # 정렬 키는 sort_values의 key로 계산하므로 복사본이나 임시 컬럼을 만들지 않습니다.
+    top_level_tasks = df_filtered[df_filtered["상위 항목 ID"].isnull()].sort_values(
+        by=['구분_lower', '이름'],
+        key=lambda col: col.map(type_sort_order).fillna(1) if col.name == '구분_lower' else col,
+        kind='stable',
+    ).reset_index(drop=True)
 
-    # X축 범위 계산 및 데이터 준비
-    all_descendant_end_dates = []
-    df_indexed_by_id = df_full_data.set_index('id') 
+    fig = go.Figure()
 
-    for _, top_task in top_level_tasks.iterrows():
-        top_task_id = top_task["id"]
-        descendant_details = get_descendant_end_details(top_task_id, df_indexed_by_id, parent_child_map)
-        all_descendant_end_dates.extend([d['date'] for d in descendant_details])
+    # 필터와 무관한 입력값은 캐시에서 가져옵니다.
+    id_index, indptr, children, records = build_chart_inputs(df_full_data)
+    top_task_rows = id_index.get_indexer(top_level_tasks["id"])
 
-    valid_end_dates = pd.Series(all_descendant_end_dates).dropna()
-    min_date = valid_end_dates.min() if not valid_end_dates.empty else pd.Timestamp.now() - timedelta(days=30)
-    max_date = valid_end_dates.max() if not valid_end_dates.empty else pd.Timestamp.now() + timedelta(days=30)
-    
-    # --- Y축 간격 확보를 위한 숫자 매핑 ---
-    y_axis_spacing_factor = 60.0 
-    y_axis_map = {name: i * y_axis_spacing_factor for i, name in enumerate(top_level_tasks["이름"].tolist())}
-    y_tickvals = list(y_axis_map.values())
-    y_ticktext = list(y_axis_map.keys())
-    y_range_min = y_tickvals[-1] + y_axis_spacing_factor * 0.5 if y_tickvals else 1.0
-    y_range_max = y_tickvals[0] - y_axis_spacing_factor * 0.5 if y_tickvals else 0.0
-    
-    # Y축 카테고리 설정용 더미 Scatter 트레이스 추가
-    fig.add_trace(go.Scatter(
-        x=[min_date, max_date], 
-        y=[y_axis_map.get(name, 0) for name in top_level_tasks["이름"].tolist()],
-        mode='text', showlegend=False, hoverinfo='skip'
-    ))
+    # 최상위 항목별 하위 태스크 정보는 한 번만 수집하고, 이후 트레이스 생성 시 재사용합니다.
+    descendant_details_by_task = {}
+    for top_task_id, top_task_row in zip(top_level_tasks["id"].values, top_task_rows):
+        descendant_details_by_task[top_task_id] = get_descendant_end_details(top_task_row, indptr, children, records)
 
-    fig.update_yaxes(autorange="reversed") 
+    # --- Y축: 최상위 항목 이름을 카테고리로 사용 (정렬된 순서대로 위에서부터 표시) ---
+    y_categories = list(dict.fromkeys(top_level_tasks["이름"].tolist()))
 
-    plotly_qualitative_colors = px.colors.qualitative.Plotly 
-    
-    # 하위 항목 이름에 색상을 매핑하는 딕셔너리를 생성합니다.
-    all_descendant_names = sorted(list(set(df_full_data[df_full_data['상위 항목 ID'].notnull()]['이름'].unique())))
-    color_map = {}
-    for i, name in enumerate(all_descendant_names):
-        color_map[name] = plotly_qualitative_colors[i % len(plotly_qualitative_colors)]
-    
     # --- 색상 조건 설정: project는 흰색, poc는 진한 파란색 (다크 테마용) ---
     color_map_main = {
         'project': 'white', 
@@ -307,59 +523,81 @@ def create_timeline_chart(df_filtered: pd.DataFrame, df_full_data: pd.DataFrame)
     # Y축 라벨 폰트 색상을 저장할 딕셔너리
     label_color_map = {} 
 
-    # 각 최상위 태스크에 대한 타임라인 트레이스를 추가합니다.
-    for _, top_task in top_level_tasks.iterrows():
-        top_task_id = top_task["id"]
-        top_task_name = top_task["이름"]
-        top_task_type = top_task["구분_lower"] 
+    # 점 개수가 많으면 WebGL 기반 Scattergl로 전환합니다.
+    total_points = sum(len(details) for details in descendant_details_by_task.values())
+    scatter_trace_cls = go.Scattergl if total_points > SCATTERGL_MIN_POINTS else go.Scatter
+
+    # 선 색상이 같은 프로젝트들은 None 구분자로 이어 붙여 하나의 트레이스로 그립니다.
+    # (None 위치에서 선이 끊기므로 프로젝트별 선은 서로 연결되지 않습니다.)
+    segments_by_color = {}
+
+    # 각 최상위 태스크의 타임라인 데이터를 색상별 트레이스 데이터에 추가합니다.
+    for top_task_id, top_task_name, top_task_type in zip(
+        top_level_tasks["id"].values,
+        top_level_tasks["이름"].values,
+        top_level_tasks["구분_lower"].values,
+    ):
 
         line_dot_color = color_map_main.get(top_task_type, 'gray')
         
         label_color_map[top_task_name] = line_dot_color
         
-        descendant_details = get_descendant_end_details(top_task_id, df_indexed_by_id, parent_child_map)
+        descendant_details = descendant_details_by_task.get(top_task_id, [])
         
         if descendant_details:
-            descendant_details.sort(key=lambda x: x['date'])
-            
-            x_coords = [d['date'] for d in descendant_details]
-            y_coords = [y_axis_map[top_task_name]] * len(x_coords)
+            # descendant_details는 이미 날짜순으로 정렬되어 있습니다.
+            # 같은 날짜의 하위 태스크는 점 하나로 합칩니다. (타임라인은 날짜 단위로 파싱되어 있음)
+            day_groups = [list(group) for _, group in groupby(descendant_details, key=lambda x: x['date'])]
+
+            x_coords = [group[0]['date'] for group in day_groups]
+            y_coords = [top_task_name] * len(x_coords)
             
-            # 호버 텍스트 구성
+            # 호버 텍스트 구성 (같은 날짜의 태스크 이름을 모두 표시하고, 여러 개면 개수도 표시)
+            # 프로젝트 줄은 한 번만 만들고, 태스크 줄은 미리 만들어 둔 문자열을 이어 붙입니다.
+            project_label = f"<b>프로젝트: {top_task_name}</b><br>"
             hover_texts = [
-                f"<b>프로젝트: {top_task_name}</b><br>"
-                f"<b>태스크: {d['name']}</b><br>"
-                f"날짜: {d['date'].strftime('%Y/%m/%d')}"
-                for d in descendant_details
+                project_label
+                + "".join([d['task_label'] for d in group])
+                + (f"태스크 수: {len(group)}<br>" if len(group) > 1 else "")
+                + "날짜: " + group[0]['date_label']
+                for group in day_groups
             ]
 
-            # 하위 항목 이름에 따라 점 색상 할당
-            colors_for_points = [color_map.get(d['name'], 'lightgray') for d in descendant_details]
-            
-            # Scatter 트레이스 추가
-            fig.add_trace(
-                go.Scatter(
-                    x=x_coords,
-                    y=y_coords,
-                    mode='lines+markers',
-                    marker=dict(
-                        symbol='circle',
-                        size=15,
-                        color=colors_for_points, 
-                        line=dict(width=1, color=line_dot_color) 
-                    ),
-                    line=dict(color=line_dot_color, width=3), 
-                    name=f"{top_task_name} 하위 타임라인",
-                    hoverinfo='text',
-                    hovertext=hover_texts,
-                    showlegend=False
-                )
+            # 하위 항목 이름에 따라 점 색상 할당 (합쳐진 점은 첫 번째 태스크 기준)
+            colors_for_points = [group[0]['color'] for group in day_groups]
+
+            # None 구분자 위치의 점은 그려지지 않으므로 색상 자리는 선 색상으로 채웁니다.
+            segment = segments_by_color.setdefault(line_dot_color, {'x': [], 'y': [], 'hover': [], 'colors': []})
+            segment['x'].extend(x_coords + [None])
+            segment['y'].extend(y_coords + [None])
+            segment['hover'].extend(hover_texts + [None])
+            segment['colors'].extend(colors_for_points + [line_dot_color])
+
+    # 색상별로 Scatter(또는 Scattergl) 트레이스 추가
+    for line_dot_color, segment in segments_by_color.items():
+        fig.add_trace(
+            scatter_trace_cls(
+                x=segment['x'],
+                y=segment['y'],
+                mode='lines+markers',
+                marker=dict(
+                    symbol='circle',
+                    size=15,
+                    color=segment['colors'], 
+                    line=dict(width=1, color=line_dot_color) 
+                ),
+                line=dict(color=line_dot_color, width=3), 
+                connectgaps=False,
+                hoverinfo='text',
+                hovertext=segment['hover'],
+                showlegend=False
             )
+        )
     
     # Y축 틱 텍스트에 색상 적용
     colored_y_ticktext = [
         f'<span style="color:{label_color_map.get(text, "gray")};">{text}</span>'
-        for text in y_ticktext
+        for text in y_categories
     ]
 
     # 차트의 전체 레이아웃을 설정합니다.
@@ -375,8 +613,14 @@ def create_timeline_chart(df_filtered: pd.DataFrame, df_full_data: pd.DataFrame)
             font=dict(size=20)
         ),
         hovermode="closest",
+        # 다시 그려져도 사용자의 확대/이동 상태를 유지합니다.
+        uirevision="gantt-timeline",
+        # 다시 그릴 때 전환 애니메이션을 생략합니다.
+        transition=dict(duration=0),
         xaxis=dict(
-            autorange=True,
+            # 표시할 마일스톤이 없으면 오늘 기준 ±30일을 보여줍니다.
+            autorange=bool(total_points),
+            range=None if total_points else [pd.Timestamp.now() - timedelta(days=30), pd.Timestamp.now() + timedelta(days=30)],
             showgrid=True,
             tickformat="%Y/%m/%d",
             tickfont=dict(size=14)
@@ -386,11 +630,13 @@ def create_timeline_chart(df_filtered: pd.DataFrame, df_full_data: pd.DataFrame)
             tickfont=dict(size=16), 
             automargin=True,
             ticklen=5,
-            type='linear', 
+            type='category', 
+            categoryorder='array',
+            categoryarray=y_categories,
+            autorange='reversed',
             tickmode='array', 
-            tickvals=y_tickvals, 
+            tickvals=y_categories, 
             ticktext=colored_y_ticktext, 
-            range=[y_range_min, y_range_max],
             fixedrange=False,
         ),
         margin=dict(l=150, r=20, t=20, b=20),
@@ -404,8 +650,8 @@ if __name__ == "__main__":
         st.error("Streamlit Secrets(`NOTION_TOKEN`, `DATABASE_ID`)이 설정되지 않았습니다.")
         st.info("Secrets를 설정해주세요.")
     else:
-        # 1. 데이터 로드 (캐시 적용)
-        df_full_data = process_notion_data(get_notion_database_data(db_id))
+        # 1. 데이터 로드 (메모리 캐시 + parquet 디스크 캐시 적용)
+        df_full_data = load_cached_df(db_id)
 
         if not df_full_data.empty:
             # '구분' 컬럼의 고유 값 추출 및 소문자 변환
@@ -443,15 +689,8 @@ if __name__ == "__main__":
 
             # 3. 차트 표시
             if not df_filtered.empty:
-                # Streamlit 컴포넌트 제목 표시
-                st.markdown(
-                    """
-                    <div style="background-color:#FFA500; color:white; padding:10px; border-radius:5px; text-align:left; font-size:20px; margin-bottom: 20px;">
-                        <b>프로젝트 일정 Summary</b>
-                    </div>
-                    """,
-                    unsafe_allow_html=True 
-                )
+                # Streamlit 컴포넌트 제목 표시 (HTML 없이 기본 헤더 + 주황색 구분선 사용)
+                st.header("프로젝트 일정 Summary", divider="orange")
                 
                 # 필터링된 데이터를 사용하여 차트 생성
                 chart_figure, top_level_tasks_plot = create_timeline_chart(df_filtered, df_full_data) 